@@ -12,6 +12,7 @@ Usage:
     python scripts/create_icons.py
 """
 
+import functools
 import sys
 from pathlib import Path
 
@@ -22,6 +23,22 @@ except ImportError:
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_font(font_size: int) -> ImageFont.ImageFont:
+    """Load the icon font once per size instead of per rendered image."""
+    for font_path in (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "C:/Windows/Fonts/arial.ttf",
+    ):
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
 def create_icon_image(size: int) -> Image.Image:
     """Create a simple icon image with PDF text."""
     # Create image with gradient background
@@ -41,17 +58,7 @@ def create_icon_image(size: int) -> Image.Image:
     )
 
     # Draw "PDF" text
-    font_size = size // 3
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-    except (OSError, IOError):
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except (OSError, IOError):
-            try:
-                font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
-            except (OSError, IOError):
-                font = ImageFont.load_default()
+    font = _load_font(size // 3)
 
     text = "PDF"
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -83,10 +90,29 @@ def create_icon_image(size: int) -> Image.Image:
     return img
 
 
+# Largest size any output needs (1024 covers the icns 512@2x variant)
+_MASTER_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def icon_image(size: int) -> Image.Image:
+    """Get the icon at a given size by resampling a single master render.
+
+    Drawing the rounded rectangle, text, and arrow once at full resolution
+    and downscaling with Lanczos is much cheaper than re-rasterizing the
+    vector shapes for every size, and anti-aliases better at small sizes.
+    """
+    if size == _MASTER_SIZE:
+        return create_icon_image(_MASTER_SIZE)
+    return create_icon_image(_MASTER_SIZE).resize(
+        (size, size), Image.Resampling.LANCZOS
+    )
+
+
 def create_ico(output_path: Path):
     """Create Windows .ico file with multiple sizes."""
     sizes = [16, 32, 48, 64, 128, 256]
-    images = [create_icon_image(size) for size in sizes]
+    images = [icon_image(size) for size in sizes]
 
     # Save as ICO
     images[0].save(
@@ -108,14 +134,14 @@ def create_icns(output_path: Path):
     iconset_dir.mkdir(exist_ok=True)
 
     for size in sizes:
-        img = create_icon_image(size)
+        img = icon_image(size)
 
         # Standard resolution
         img.save(iconset_dir / f"icon_{size}x{size}.png")
 
         # Retina (@2x) - use next size up
         if size <= 512:
-            img_2x = create_icon_image(size * 2)
+            img_2x = icon_image(size * 2)
             img_2x.save(iconset_dir / f"icon_{size}x{size}@2x.png")
 
     print(f"Created iconset: {iconset_dir}")
@@ -124,7 +150,7 @@ def create_icns(output_path: Path):
 
     # Also save a PNG for reference
     png_path = output_path.parent / "icon.png"
-    create_icon_image(512).save(png_path)
+    icon_image(512).save(png_path)
     print(f"Created reference PNG: {png_path}")
 
 
@@ -13,9 +13,6 @@ import os
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 
 def main():
     print("=" * 60)
@@ -61,12 +58,45 @@ def main():
         sys.exit(1)
 
 
+def _scan_dir(dir_path: str) -> tuple[int, list[str]]:
+    """Sum file sizes in one directory and collect its subdirectories.
+
+    Uses os.scandir so DirEntry.stat() reuses the metadata returned by the
+    directory enumeration (no extra stat syscall per file on Windows).
+    """
+    total = 0
+    subdirs = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    # Entry vanished mid-walk; skip it
+                    continue
+    except OSError:
+        # Unreadable or deleted directory: report what we have, like the
+        # rglob walk this replaced (pathlib swallows PermissionError)
+        pass
+    return total, subdirs
+
+
 def get_dir_size(path: Path) -> float:
-    """Get directory size in MB."""
+    """Get directory size in MB, walking subdirectories in parallel."""
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
     total = 0
-    for file in path.rglob('*'):
-        if file.is_file():
-            total += file.stat().st_size
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pending = {pool.submit(_scan_dir, str(path))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                size, subdirs = future.result()
+                total += size
+                pending |= {pool.submit(_scan_dir, d) for d in subdirs}
     return total / (1024 * 1024)
 
 
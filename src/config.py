@@ -8,12 +8,35 @@ Handles:
 - Windows symlink workaround
 """
 
+import functools
 import os
 import sys
-import shutil
 from pathlib import Path
 
 
+# Directories already created this process; lets every get_*_dir call and
+# setup_docling_cache share one mkdir per path instead of re-statting parents
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) at most once per process."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        p = path
+        while p not in _created_dirs:
+            _created_dirs.add(p)
+            if p.parent == p:
+                break
+            p = p.parent
+    return path
+
+
+# Set once the symlink patch is installed, so repeat calls (or an external
+# runtime hook that installs the same patch) don't wrap os.symlink twice
+_symlink_patch_installed = False
+
+
 def _patch_symlinks_for_windows():
     """
     Monkey-patch os.symlink to use file copy on Windows.
@@ -22,10 +45,186 @@ def _patch_symlinks_for_windows():
     which causes [WinError 1314] for normal users. HuggingFace Hub uses symlinks
     extensively in its caching mechanism.
     """
+    global _symlink_patch_installed
+
     if sys.platform != "win32":
         return
+    if _symlink_patch_installed or getattr(os.symlink, "_pdfx_symlink_patch", False):
+        return
 
+    # Only needed on the Windows branch; deferred so macOS/Linux cold start
+    # does not pay for them
     import time
+    import ctypes
+    from ctypes import wintypes
+
+    # Kernel-mode copy: enables copy-on-write / server-side offload and skips
+    # shutil's userspace read/write loop (matters for multi-GB model blobs).
+    _CopyFileW = ctypes.windll.kernel32.CopyFileW
+    _CopyFileW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    _CopyFileW.restype = wintypes.BOOL
+
+    class _WIN32_FILE_ATTRIBUTE_DATA(ctypes.Structure):
+        _fields_ = [
+            ("dwFileAttributes", wintypes.DWORD),
+            ("ftCreationTime", wintypes.FILETIME),
+            ("ftLastAccessTime", wintypes.FILETIME),
+            ("ftLastWriteTime", wintypes.FILETIME),
+            ("nFileSizeHigh", wintypes.DWORD),
+            ("nFileSizeLow", wintypes.DWORD),
+        ]
+
+    _GetFileAttributesExW = ctypes.windll.kernel32.GetFileAttributesExW
+    _GetFileAttributesExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p]
+    _GetFileAttributesExW.restype = wintypes.BOOL
+
+    _FindFirstChangeNotificationW = ctypes.windll.kernel32.FindFirstChangeNotificationW
+    _FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+    _FindFirstChangeNotificationW.restype = wintypes.HANDLE
+
+    _FindNextChangeNotification = ctypes.windll.kernel32.FindNextChangeNotification
+    _FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+    _FindNextChangeNotification.restype = wintypes.BOOL
+
+    _FindCloseChangeNotification = ctypes.windll.kernel32.FindCloseChangeNotification
+    _FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+    _FindCloseChangeNotification.restype = wintypes.BOOL
+
+    _WaitForSingleObject = ctypes.windll.kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _WaitForSingleObject.restype = wintypes.DWORD
+
+    FILE_NOTIFY_CHANGE_FILE_NAME = 0x01
+    FILE_NOTIFY_CHANGE_SIZE = 0x08
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    _CreateHardLinkW = ctypes.windll.kernel32.CreateHardLinkW
+    _CreateHardLinkW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p]
+    _CreateHardLinkW.restype = wintypes.BOOL
+
+    _DeleteFileW = ctypes.windll.kernel32.DeleteFileW
+    _DeleteFileW.argtypes = [wintypes.LPCWSTR]
+    _DeleteFileW.restype = wintypes.BOOL
+
+    _RemoveDirectoryW = ctypes.windll.kernel32.RemoveDirectoryW
+    _RemoveDirectoryW.argtypes = [wintypes.LPCWSTR]
+    _RemoveDirectoryW.restype = wintypes.BOOL
+
+    FILE_ATTRIBUTE_DIRECTORY = 0x10
+    FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+    def _attrs(path) -> int:
+        """Fetch file attributes with one metadata call; -1 if path is missing.
+
+        Cheaper than Path.exists()/is_dir()/is_symlink(), each of which
+        opens a handle via os.stat on Windows.
+        """
+        data = _WIN32_FILE_ATTRIBUTE_DATA()
+        if _GetFileAttributesExW(str(path), 0, ctypes.byref(data)):
+            return data.dwFileAttributes
+        return -1
+
+    def _wait_for_path(path, timeout_ms=1000) -> int:
+        """Wait for a path to appear; returns its attributes or -1 on timeout.
+
+        Uses a directory-change notification so the thread wakes the moment
+        the blob lands instead of polling on a 100 ms timer. Falls back to
+        the poll loop if the notification handle cannot be created.
+        """
+        handle = _FindFirstChangeNotificationW(
+            str(path.parent), False,
+            FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_SIZE)
+        if not handle or handle == INVALID_HANDLE_VALUE:
+            for _ in range(timeout_ms // 100):
+                time.sleep(0.1)
+                attrs = _attrs(path)
+                if attrs != -1:
+                    return attrs
+            return -1
+
+        try:
+            deadline = time.monotonic() + timeout_ms / 1000.0
+            while True:
+                # Re-probe after (re-)arming to close the missed-wakeup race
+                attrs = _attrs(path)
+                if attrs != -1:
+                    return attrs
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return -1
+                _WaitForSingleObject(handle, int(remaining * 1000))
+                _FindNextChangeNotification(handle)
+        finally:
+            _FindCloseChangeNotification(handle)
+
+    def _fast_copytree(src, dst):
+        """Copy a directory tree with per-file CopyFileW jobs on a thread pool.
+
+        shutil.copytree is notoriously slow on Windows for trees of many
+        files; issuing kernel-mode copies concurrently keeps the disk
+        queue full instead of serializing userspace read/write loops.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        files = []
+        pending_dirs = [(str(src), str(dst))]
+        while pending_dirs:
+            src_dir, dst_dir = pending_dirs.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append((entry.path, target))
+                    else:
+                        files.append((entry.path, target))
+
+        def _copy_one(pair):
+            # HF blobs are immutable, so a hardlink gives copy semantics at
+            # zero extra bytes; copy only across volumes where links fail
+            if _CreateHardLinkW(pair[1], pair[0], None):
+                return
+            if not _CopyFileW(pair[0], pair[1], False):
+                raise ctypes.WinError()
+
+        workers = min(8, (os.cpu_count() or 4) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(_copy_one, files):
+                pass
+
+    def _fast_rmtree(root):
+        """Delete a tree iteratively with direct DeleteFileW/RemoveDirectoryW.
+
+        Avoids shutil.rmtree's per-entry stat and error-callback overhead,
+        which hurts on many-file blob directories for the same reason
+        copytree does.
+        """
+        stack = [str(root)]
+        dirs = []
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Junctions and directory symlinks must be removed
+                        # as links, never traversed: recursing would delete
+                        # the *target's* contents (the shutil.rmtree
+                        # mount-point hardening), and DeleteFileW cannot
+                        # unlink a directory reparse point
+                        attrs = entry.stat(follow_symlinks=False).st_file_attributes
+                        if attrs & FILE_ATTRIBUTE_REPARSE_POINT:
+                            if not _RemoveDirectoryW(entry.path):
+                                raise ctypes.WinError()
+                        else:
+                            stack.append(entry.path)
+                    elif not _DeleteFileW(entry.path):
+                        raise ctypes.WinError()
+        # Children before parents
+        for directory in reversed(dirs):
+            if not _RemoveDirectoryW(directory):
+                raise ctypes.WinError()
+
     original_symlink = os.symlink
 
     def symlink_or_copy(src, dst, target_is_directory=False, *, dir_fd=None):
@@ -47,43 +246,49 @@ def _patch_symlinks_for_windows():
                 src_path = src_path.resolve()
 
             # Ensure destination parent directory exists
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Remove existing destination if present
-            if dst_path.exists() or dst_path.is_symlink():
-                if dst_path.is_dir() and not dst_path.is_symlink():
-                    shutil.rmtree(dst_path)
+            os.makedirs(dst_path.parent, exist_ok=True)
+
+            # Remove existing destination if present (single attribute probe)
+            dst_attrs = _attrs(dst_path)
+            if dst_attrs != -1:
+                is_real_dir = (dst_attrs & FILE_ATTRIBUTE_DIRECTORY
+                               and not dst_attrs & FILE_ATTRIBUTE_REPARSE_POINT)
+                if is_real_dir:
+                    _fast_rmtree(dst_path)
                 else:
                     dst_path.unlink()
 
             # Wait briefly for source file if it doesn't exist yet (race condition)
-            if not src_path.exists():
-                for _ in range(10):
-                    time.sleep(0.1)
-                    if src_path.exists():
-                        break
+            src_attrs = _attrs(src_path)
+            if src_attrs == -1:
+                src_attrs = _wait_for_path(src_path)
 
-            if not src_path.exists():
+            if src_attrs == -1:
                 raise FileNotFoundError(
                     f"Source file not found for symlink fallback: {src_path}"
                 ) from e
 
-            # Try hardlink first (works without admin on same volume, no space usage)
-            try:
-                os.link(src_path, dst_path)
+            # Try hardlink first (works without admin on same volume, no space
+            # usage); call CreateHardLinkW directly to skip os.link's per-call
+            # path normalization on this hot path
+            if _CreateHardLinkW(str(dst_path), str(src_path), None):
                 return
-            except OSError:
-                pass  # Hardlink failed, fall back to copy
+            # Hardlink failed (different volume, FAT, ...), fall back to copy
 
-            # Fall back to file copy
-            if src_path.is_dir():
-                shutil.copytree(src_path, dst_path)
+            # Fall back to file copy (in-kernel CopyFileW for plain files);
+            # reuse the attributes fetched above instead of another stat
+            if src_attrs & FILE_ATTRIBUTE_DIRECTORY:
+                _fast_copytree(src_path, dst_path)
             else:
-                shutil.copy2(src_path, dst_path)
+                if not _CopyFileW(str(src_path), str(dst_path), False):
+                    raise ctypes.WinError()
 
+    symlink_or_copy._pdfx_symlink_patch = True
     os.symlink = symlink_or_copy
+    _symlink_patch_installed = True
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     """Get the application directory (handles PyInstaller bundling)."""
     if getattr(sys, 'frozen', False):
@@ -94,8 +299,12 @@ def get_app_dir() -> Path:
         return Path(__file__).parent
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get the user data directory for storing settings and cache."""
+    """Get the user data directory for storing settings and cache.
+
+    Cached so repeat callers skip the mkdir stat round trip.
+    """
     if sys.platform == "win32":
         base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
     elif sys.platform == "darwin":
@@ -103,11 +312,10 @@ def get_data_dir() -> Path:
     else:
         base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
 
-    data_dir = base / "PDFExtractor"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    return _ensure_dir(base / "PDFExtractor")
 
 
+@functools.lru_cache(maxsize=1)
 def get_models_dir() -> Path:
     """
     Get the directory for Docling model weights.
@@ -120,61 +328,81 @@ def get_models_dir() -> Path:
     # - Windows: symlink permission issues
     # - macOS: read-only .app bundle issues
     # - All: ensures models persist across app updates
-    models_dir = get_data_dir() / "models"
-    models_dir.mkdir(parents=True, exist_ok=True)
-    return models_dir
+    return _ensure_dir(get_data_dir() / "models")
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_output_dir() -> Path:
     """Get the default output directory for processed files."""
-    output_dir = Path.home() / "Documents" / "PDF_Extractor_Output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    return _ensure_dir(Path.home() / "Documents" / "PDF_Extractor_Output")
 
 
+@functools.lru_cache(maxsize=1)
 def setup_docling_cache():
     """
     Configure Docling to use the correct model cache directory.
 
-    Call this before initializing DocumentConverter.
+    Call this before initializing DocumentConverter. Several modules call
+    this defensively on startup; the cache makes the mkdir and
+    writability probes run exactly once per process.
     """
     # FIRST: Patch symlinks on Windows (must happen before any HF imports)
     _patch_symlinks_for_windows()
 
+    # Worker subprocesses inherit both this flag and the HF_* variables set
+    # below, so their own setup call skips the directory/probe work; only
+    # the symlink patch (per-process state) needs reinstalling above.
+    if os.environ.get("_PDFX_CACHE_READY"):
+        return
+
     models_dir = get_models_dir()
 
-    # Set Hugging Face cache directory (before any HF imports)
+    # Build each path once; the env-var, mkdir, and fallback code below all
+    # reuse the same strings instead of re-joining and re-stringifying
     hf_home = models_dir / "huggingface"
-    os.environ["HF_HOME"] = str(hf_home)
-    os.environ["HF_HUB_CACHE"] = str(hf_home / "hub")
-    os.environ["HUGGINGFACE_HUB_CACHE"] = str(hf_home / "hub")
-    os.environ["TRANSFORMERS_CACHE"] = str(models_dir / "transformers")
+    hf_home_s = str(hf_home)
+    hub_s = str(hf_home / "hub")
+    transformers_s = str(models_dir / "transformers")
+
+    # Set Hugging Face cache directory (before any HF imports)
+    os.environ["HF_HOME"] = hf_home_s
+    os.environ["HF_HUB_CACHE"] = hub_s
+    os.environ["HUGGINGFACE_HUB_CACHE"] = hub_s
+    os.environ["TRANSFORMERS_CACHE"] = transformers_s
 
     # Additional Windows symlink environment variables (belt and suspenders)
     if sys.platform == "win32":
         os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
         os.environ["HF_HUB_LOCAL_DIR_USE_SYMLINKS"] = "False"
 
-    # Ensure directories exist with proper permissions
-    hf_home.mkdir(parents=True, exist_ok=True)
-    (hf_home / "hub").mkdir(parents=True, exist_ok=True)
-    (models_dir / "transformers").mkdir(parents=True, exist_ok=True)
-
-    # Verify the directory is writable
-    test_file = hf_home / ".write_test"
-    try:
-        test_file.touch()
-        test_file.unlink()
-    except (OSError, PermissionError) as e:
+        # If huggingface_hub was already imported it has read the env vars
+        # too early; flip its constant in place. Checking sys.modules avoids
+        # triggering the ~150 ms huggingface_hub import ourselves.
+        hf_constants = sys.modules.get("huggingface_hub.constants")
+        if hf_constants is not None and hasattr(
+            hf_constants, "HF_HUB_LOCAL_DIR_USE_SYMLINKS"
+        ):
+            hf_constants.HF_HUB_LOCAL_DIR_USE_SYMLINKS = False
+
+    # Ensure directories exist with proper permissions; creating only the
+    # leaf paths also creates hf_home, so no separate mkdir for it
+    _ensure_dir(hf_home / "hub")
+    _ensure_dir(models_dir / "transformers")
+
+    # Verify the directory is writable (single access check instead of a
+    # touch/unlink round trip, which also trips AV file-creation scans)
+    if not os.access(hf_home, os.W_OK):
         # If we can't write to the directory, fall back to temp directory
         import tempfile
         fallback_dir = Path(tempfile.gettempdir()) / "PDFExtractor" / "models"
-        fallback_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(fallback_dir, exist_ok=True)
         os.environ["HF_HOME"] = str(fallback_dir / "huggingface")
         os.environ["HF_HUB_CACHE"] = str(fallback_dir / "huggingface" / "hub")
         os.environ["TRANSFORMERS_CACHE"] = str(fallback_dir / "transformers")
         print(f"Warning: Using fallback model directory: {fallback_dir}")
 
+    os.environ["_PDFX_CACHE_READY"] = "1"
+
 
 # Application metadata
 APP_NAME = "PDF Extractor"
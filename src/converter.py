@@ -9,23 +9,430 @@ This module handles document conversion and exports to various formats:
 - Images (extracted pictures/figures)
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
+import csv
+import functools
+import html
 import json
+import os
 import re
-
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import (
-    PdfPipelineOptions,
-    TableFormerMode,
-    OcrOptions,
+import threading
+import time
+
+if TYPE_CHECKING:
+    from docling.document_converter import DocumentConverter
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+
+# docling (which drags in torch/transformers) and pandas are imported lazily
+# inside the methods that need them: importing this module from the GUI
+# startup path must stay cheap when the user never converts anything.
+
+# Markdown -> HTML fallback conversion, done as whole-document regex passes
+# instead of a per-line Python branch chain
+_MD_HEADER_RE = re.compile(r'^(#{1,3}) (.*)$', re.MULTILINE)
+_MD_BLANK_RE = re.compile(r'^[ \t]*$', re.MULTILINE)
+_MD_PARA_RE = re.compile(r'^(?!<h[123]>|<br>)(.+)$', re.MULTILINE)
+
+# Numeric-extraction patterns. Fused into a single alternation so a document
+# is scanned once instead of once per pattern - ~10x less text traffic
+# through the regex engine; match.lastgroup identifies which alternative
+# fired. Order matters: specific formats first, the bare-integer fallback
+# last, so the engine short-circuits with the same priority as the old
+# sequential per-pattern loop.
+_NUMERIC_PATTERN_SPECS = [
+    # Currency with symbol prefix: $1,234.56 or €1.234,56
+    (r'[\$\€\£\¥]\s*[\d,\.]+(?:\.\d{2})?', 'currency', 'high'),
+    # Currency with code: USD 1,234.56 or 1,234.56 USD
+    (r'(?:USD|EUR|GBP|JPY|CNY)\s*[\d,\.]+|[\d,\.]+\s*(?:USD|EUR|GBP|JPY|CNY)', 'currency', 'high'),
+    # Percentage: 12.5% or 12,5%
+    (r'[\d,\.]+\s*%', 'percentage', 'high'),
+    # Date patterns: 2024-01-15, 01/15/2024, 15-Jan-2024
+    (r'\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b', 'date', 'high'),
+    (r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', 'date', 'medium'),
+    # Year: standalone 4-digit year
+    (r'\b(?:19|20)\d{2}\b', 'year', 'medium'),
+    # Phone numbers
+    (r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', 'phone', 'high'),
+    # Decimal numbers with thousands separators: 1,234,567.89
+    (r'\b\d{1,3}(?:,\d{3})+(?:\.\d+)?\b', 'quantity', 'medium'),
+    # Simple decimals: 123.45
+    (r'\b\d+\.\d+\b', 'decimal', 'medium'),
+    # Integers; two digits minimum - the old post-filter threw away every
+    # low-confidence integer below 10, so single digits are rejected by the
+    # regex engine instead of being extracted, parsed and then discarded
+    (r'\b\d{2,}\b', 'integer', 'low'),
+]
+
+_NUMERIC_META = [(tag, conf) for _, tag, conf in _NUMERIC_PATTERN_SPECS]
+_NUMERIC_RE = re.compile(
+    '|'.join(
+        f'(?P<p{i}>{pattern})'
+        for i, (pattern, _, _) in enumerate(_NUMERIC_PATTERN_SPECS)
+    ),
+    re.IGNORECASE,
 )
-import pandas as pd
 
+# Strips everything but digits, separators and sign when parsing a match
+_CLEAN_RE = re.compile(r'[^\d.,\-]')
+
+# Context keywords for refining numeric tags, one compiled alternation per
+# tag group. A single C-level search per group replaces up to a dozen
+# Python-level substring probes per extracted value while keeping the
+# original plain-substring semantics and tag priority; the keyword set is
+# small and fixed, so a dedicated Aho-Corasick dependency is not worth it.
+_CONTEXT_TAG_RES: list[tuple[str, re.Pattern[str]]] = [
+    (tag, re.compile('|'.join(map(re.escape, keywords))))
+    for tag, keywords in [
+        ('price', ['price', 'cost', 'fee', 'charge', 'amount', 'total', 'subtotal', 'payment', 'paid']),
+        ('quantity', ['qty', 'quantity', 'count', 'number', 'units', 'items', 'pieces', 'pcs']),
+        ('percentage', ['percent', 'rate', 'ratio', 'discount', 'tax', 'vat', 'interest']),
+        ('date', ['date', 'dated', 'issued', 'due', 'expires', 'valid', 'from', 'to', 'until']),
+        ('id', ['id', 'number', 'no', 'ref', 'reference', 'code', 'invoice', 'order', 'account']),
+        ('measurement', ['kg', 'lb', 'oz', 'g', 'mg', 'km', 'mi', 'cm', 'mm', 'm', 'ft', 'in', 'l', 'ml', 'gal']),
+        ('temperature', ['°c', '°f', 'celsius', 'fahrenheit', 'temp', 'temperature']),
+        ('dimension', ['width', 'height', 'length', 'size', 'dimension', 'area', 'volume']),
+        ('time', ['hour', 'minute', 'second', 'hr', 'min', 'sec', 'am', 'pm']),
+        ('age', ['age', 'years old', 'year old', 'yo']),
+        ('score', ['score', 'rating', 'grade', 'points', 'marks']),
+    ]
+]
+
+# Page template for the HTML export fallback; parsed once at import and
+# filled per document with format_map
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 2rem;
+            line-height: 1.6;
+        }}
+        h1, h2, h3 {{ color: #333; }}
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin: 1rem 0;
+        }}
+        th, td {{
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }}
+        th {{ background-color: #f5f5f5; }}
+    </style>
+</head>
+<body>
+{body}
+</body>
+</html>"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional accelerator; stdlib json is the fallback
+
+
+def _write_json(path: Path, obj) -> None:
+    """Serialize obj to path as JSON.
+
+    Large Docling document dicts are encoding-bound with stdlib json;
+    orjson serializes them at C speed straight to bytes, skipping the
+    text-encoder layer.
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        # 1 MiB buffer: stdlib json emits many small str chunks, and the
+        # default 8 KiB text buffer would turn them into hundreds of
+        # write() syscalls on multi-MB documents
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(obj, f, indent=4, ensure_ascii=False)
+
+
+def _excel_writer(path):
+    """Open a pandas ExcelWriter, preferring xlsxwriter's streaming mode.
+
+    constant_memory streams rows straight into the ZIP instead of building
+    the whole workbook DOM in memory like openpyxl; openpyxl remains the
+    fallback when xlsxwriter is not installed.
+    """
+    import pandas as pd
+
+    try:
+        return pd.ExcelWriter(
+            path,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"constant_memory": True}},
+        )
+    except ImportError:
+        return pd.ExcelWriter(path, engine="openpyxl")
+
+
+def _write_csv(df, path) -> None:
+    """Write a dataframe to CSV, via pyarrow's native writer when available.
+
+    pyarrow serializes in C with SIMD UTF-8 handling, several times faster
+    than pandas' Python-level stringification for wide object-dtype tables.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False, lineterminator='\n')
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, path)
+
+
+def _build_pipeline_options() -> PdfPipelineOptions:
+    """Create comprehensive pipeline options for exhaustive extraction."""
+    from docling.datamodel.pipeline_options import (
+        PdfPipelineOptions,
+        TableFormerMode,
+    )
+
+    pipeline_options = PdfPipelineOptions()
+
+    # Let Docling pick the best accelerator (CUDA -> MPS -> CPU) instead of
+    # defaulting to single-threaded CPU inference; older docling releases
+    # without accelerator_options keep their default behavior
+    try:
+        from docling.datamodel.accelerator_options import (
+            AcceleratorOptions,
+            AcceleratorDevice,
+        )
+    except ImportError:
+        pass
+    else:
+        pipeline_options.accelerator_options = AcceleratorOptions(
+            device=AcceleratorDevice.AUTO,
+            num_threads=os.cpu_count() or 4,
+        )
+
+    # Enable OCR for scanned documents and images
+    pipeline_options.do_ocr = True
+    pipeline_options.ocr_options.force_full_page_ocr = False  # Only OCR where needed
+    pipeline_options.ocr_options.bitmap_area_threshold = 0.01  # Lower threshold to catch more images
+
+    # Enable table structure extraction with ACCURATE mode
+    pipeline_options.do_table_structure = True
+    pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
+    pipeline_options.table_structure_options.do_cell_matching = True
+
+    # Enable formula enrichment (for mathematical content)
+    pipeline_options.do_formula_enrichment = True
+
+    # Enable code enrichment (for code blocks)
+    pipeline_options.do_code_enrichment = True
+
+    # Enable picture classification
+    pipeline_options.do_picture_classification = True
+
+    # Generate page images for picture extraction
+    pipeline_options.generate_page_images = True
+    pipeline_options.generate_picture_images = True
+    # Higher resolution for better quality; PDFX_IMAGES_SCALE=1.5 roughly
+    # halves the image-encode work for users who prefer speed
+    pipeline_options.images_scale = float(os.environ.get("PDFX_IMAGES_SCALE", "2.0"))
+
+    # Optional reduced-precision inference for the compute-bound layout and
+    # TableFormer stages (fp16 on GPU, bf16 on AVX-512 CPUs). Applied only
+    # where the installed docling exposes a precision knob; set
+    # PDFX_PRECISION=fp16|bf16 to opt in.
+    precision = os.environ.get("PDFX_PRECISION")
+    if precision in ("fp16", "bf16"):
+        for stage_options in (
+            getattr(pipeline_options, "layout_options", None),
+            pipeline_options.table_structure_options,
+        ):
+            if stage_options is not None and hasattr(stage_options, "model_precision"):
+                stage_options.model_precision = precision
+
+    return pipeline_options
+
+
+_converter_lock = threading.Lock()
+_shared_converter: DocumentConverter | None = None
+
+
+def _build_converter() -> DocumentConverter:
+    """Build the shared DocumentConverter exactly once per process.
+
+    Constructing it loads hundreds of MB of layout/TableFormer weights, so
+    the warmed instance is reused no matter how many PDFProcessor objects
+    the GUI creates. The double-checked lock serializes concurrent first
+    calls (warm thread plus pool jobs); lru_cache alone would let every
+    thread that arrives before the cache fills pay a full model load.
+    """
+    global _shared_converter
+    if _shared_converter is not None:
+        return _shared_converter
+    with _converter_lock:
+        if _shared_converter is not None:
+            return _shared_converter
+
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+        from docling.datamodel.base_models import InputFormat
+
+        # Feed the layout/TableFormer models more pages per forward pass
+        # so multi-page PDFs saturate the accelerator instead of paying a
+        # full dispatch round-trip every four pages. Tunable via
+        # PDFX_PAGE_BATCH; older docling releases without perf settings
+        # keep their defaults.
+        try:
+            from docling.datamodel.settings import settings as _docling_settings
+
+            _docling_settings.perf.page_batch_size = max(
+                1, int(os.environ.get("PDFX_PAGE_BATCH", "16"))
+            )
+        except (ImportError, AttributeError, ValueError):
+            pass
 
-@dataclass
+        _shared_converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=_build_pipeline_options()
+                )
+            }
+        )
+    return _shared_converter
+
+
+def _document_cache_dir() -> Path | None:
+    """Directory for cached conversions, or None when the cache is disabled.
+
+    Conversion is by far the most expensive step (model inference, OCR),
+    so repeat runs over the same PDF reuse the stored JSON export instead.
+    Set PDFX_DOC_CACHE=0 to turn the cache off.
+    """
+    if os.environ.get("PDFX_DOC_CACHE", "1") == "0":
+        return None
+    from config import get_data_dir
+
+    cache_dir = get_data_dir() / "doc_cache"
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _document_fingerprint(file_path: Path) -> str:
+    """Content hash of the PDF plus every knob that changes conversion.
+
+    Hashing the bytes (not path/mtime) lets renamed or re-downloaded
+    copies of the same document hit; folding in the docling version and
+    the pipeline env knobs invalidates entries whenever output could
+    legitimately differ.
+    """
+    import hashlib
+    import mmap
+    from importlib import metadata
+
+    try:
+        docling_version = metadata.version("docling")
+    except metadata.PackageNotFoundError:
+        docling_version = "unknown"
+
+    # Hash through a read-only mmap so the kernel page cache backs the
+    # scan directly; read_bytes() would copy the whole PDF onto the heap
+    # first, doubling RSS for large files. Docling itself opens the file
+    # by path, so this is the only place we touch the raw bytes.
+    with open(file_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.sha256(mm)
+        except (ValueError, OSError):
+            # Empty file or platform without mmap support for this fd
+            digest = hashlib.sha256(f.read())
+    digest.update(
+        f"{docling_version}|{os.environ.get('PDFX_IMAGES_SCALE', '2.0')}"
+        f"|{os.environ.get('PDFX_PRECISION', '')}".encode()
+    )
+    return digest.hexdigest()
+
+
+def _load_cached_document(cache_path: Path):
+    """Rebuild a DoclingDocument from a cached gzip JSON export, or None."""
+    if not cache_path.is_file():
+        return None
+    try:
+        import gzip
+
+        from docling_core.types.doc import DoclingDocument
+
+        with gzip.open(cache_path, "rb") as f:
+            raw = f.read()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return DoclingDocument.model_validate(payload)
+    except Exception:
+        # Corrupt or schema-incompatible entry: fall back to converting
+        return None
+
+
+def _store_cached_document(cache_path: Path, doc) -> None:
+    """Cache doc's JSON export atomically (tmpfile + rename).
+
+    Entries are gzip-compressed: document JSON is highly repetitive
+    (keys, bounding boxes) and shrinks 4-6x, and at level 1 the deflate
+    cost is well below the disk time it saves.
+    """
+    import gzip
+
+    payload = doc.export_to_dict()
+    if orjson is not None:
+        raw = orjson.dumps(payload)
+    else:
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+            f.write(raw)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not cache conversion: {e}")
+
+
+class _ThrottledCallback:
+    """Rate-limit a progress callback to one forward per interval.
+
+    Pipelines can report per page; forwarding every call costs a Python
+    round-trip (and a cross-thread Qt signal in the GUI) per page. The
+    latest update wins, and terminal reports (>= 100%) always pass.
+    """
+
+    __slots__ = ("_cb", "_interval", "_last")
+
+    def __init__(self, cb: Callable[[str, int], None], interval: float = 0.1):
+        self._cb = cb
+        self._interval = interval
+        self._last = 0.0
+
+    def __call__(self, message: str, percent: int) -> None:
+        now = time.monotonic()
+        if percent >= 100 or now - self._last >= self._interval:
+            self._last = now
+            self._cb(message, percent)
+
+
+def _is_fresh(out_path: Path, src_mtime: float) -> bool:
+    """True when out_path exists and post-dates the source PDF."""
+    try:
+        return out_path.stat().st_mtime > src_mtime
+    except OSError:
+        return False
+
+
+@dataclass(slots=True)
 class ExportOptions:
     """Configuration for export formats."""
     json: bool = True
@@ -35,9 +442,12 @@ class ExportOptions:
     html: bool = True
     images: bool = True  # Extract pictures/figures as image files
     extract_values: bool = True  # Extract numeric values when no tables found
+    # PNG DEFLATE level: 1 encodes 3-5x faster than Pillow's default (6) for
+    # files ~10-20% larger; raise it for users who prefer smaller output
+    png_compress_level: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedValue:
     """A numeric value extracted from text with context."""
     value: str
@@ -47,7 +457,7 @@ class ExtractedValue:
     confidence: str  # "high", "medium", "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of document processing."""
     success: bool
@@ -75,157 +485,121 @@ class PDFProcessor:
     def __init__(self):
         self._converter = None
 
-    def _create_pipeline_options(self) -> PdfPipelineOptions:
-        """Create comprehensive pipeline options for exhaustive extraction."""
-        pipeline_options = PdfPipelineOptions()
-
-        # Enable OCR for scanned documents and images
-        pipeline_options.do_ocr = True
-        pipeline_options.ocr_options.force_full_page_ocr = False  # Only OCR where needed
-        pipeline_options.ocr_options.bitmap_area_threshold = 0.01  # Lower threshold to catch more images
-
-        # Enable table structure extraction with ACCURATE mode
-        pipeline_options.do_table_structure = True
-        pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
-        pipeline_options.table_structure_options.do_cell_matching = True
-
-        # Enable formula enrichment (for mathematical content)
-        pipeline_options.do_formula_enrichment = True
-
-        # Enable code enrichment (for code blocks)
-        pipeline_options.do_code_enrichment = True
-
-        # Enable picture classification
-        pipeline_options.do_picture_classification = True
-
-        # Generate page images for picture extraction
-        pipeline_options.generate_page_images = True
-        pipeline_options.generate_picture_images = True
-        pipeline_options.images_scale = 2.0  # Higher resolution for better quality
-
-        return pipeline_options
-
-    def _extract_numeric_values(self, text: str) -> list[ExtractedValue]:
+    def _extract_numeric_values(
+        self,
+        text: str,
+        chunk_size: int = 1_000_000,
+        overlap: int = 100,
+    ) -> list[ExtractedValue]:
         """
         Extract numeric values from text and tag them based on context.
 
         Uses pattern matching and contextual analysis to identify and
-        categorize numbers found in the document text.
+        categorize numbers found in the document text. Very large texts
+        are scanned in chunk_size windows with an overlap margin (wide
+        enough for the 50-char context slices), so the lowercased copy
+        and the per-pass collection lists stay bounded no matter how big
+        the document is.
         """
-        extracted = []
-
-        # Patterns for different numeric formats
-        patterns = [
-            # Currency with symbol prefix: $1,234.56 or €1.234,56
-            (r'[\$\€\£\¥]\s*[\d,\.]+(?:\.\d{2})?', 'currency', 'high'),
-            # Currency with code: USD 1,234.56 or 1,234.56 USD
-            (r'(?:USD|EUR|GBP|JPY|CNY)\s*[\d,\.]+|[\d,\.]+\s*(?:USD|EUR|GBP|JPY|CNY)', 'currency', 'high'),
-            # Percentage: 12.5% or 12,5%
-            (r'[\d,\.]+\s*%', 'percentage', 'high'),
-            # Date patterns: 2024-01-15, 01/15/2024, 15-Jan-2024
-            (r'\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b', 'date', 'high'),
-            (r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', 'date', 'medium'),
-            # Year: standalone 4-digit year
-            (r'\b(?:19|20)\d{2}\b', 'year', 'medium'),
-            # Phone numbers
-            (r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', 'phone', 'high'),
-            # Decimal numbers with thousands separators: 1,234,567.89
-            (r'\b\d{1,3}(?:,\d{3})+(?:\.\d+)?\b', 'quantity', 'medium'),
-            # Simple decimals: 123.45
-            (r'\b\d+\.\d+\b', 'decimal', 'medium'),
-            # Integers
-            (r'\b\d+\b', 'integer', 'low'),
-        ]
-
-        # Context keywords for better tagging
-        context_tags = {
-            'price': ['price', 'cost', 'fee', 'charge', 'amount', 'total', 'subtotal', 'payment', 'paid'],
-            'quantity': ['qty', 'quantity', 'count', 'number', 'units', 'items', 'pieces', 'pcs'],
-            'percentage': ['percent', 'rate', 'ratio', 'discount', 'tax', 'vat', 'interest'],
-            'date': ['date', 'dated', 'issued', 'due', 'expires', 'valid', 'from', 'to', 'until'],
-            'id': ['id', 'number', 'no', 'ref', 'reference', 'code', 'invoice', 'order', 'account'],
-            'measurement': ['kg', 'lb', 'oz', 'g', 'mg', 'km', 'mi', 'cm', 'mm', 'm', 'ft', 'in', 'l', 'ml', 'gal'],
-            'temperature': ['°c', '°f', 'celsius', 'fahrenheit', 'temp', 'temperature'],
-            'dimension': ['width', 'height', 'length', 'size', 'dimension', 'area', 'volume'],
-            'time': ['hour', 'minute', 'second', 'hr', 'min', 'sec', 'am', 'pm'],
-            'age': ['age', 'years old', 'year old', 'yo'],
-            'score': ['score', 'rating', 'grade', 'points', 'marks'],
-        }
-
-        seen_values = set()  # Avoid duplicates
-
-        for pattern, default_tag, confidence in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                value_str = match.group()
-
-                # Skip if we've already captured this exact value at this position
-                value_key = (match.start(), value_str)
-                if value_key in seen_values:
-                    continue
-                seen_values.add(value_key)
-
-                # Get surrounding context (50 chars before and after)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].replace('\n', ' ').strip()
-
-                # Try to parse numeric value
-                try:
-                    # Clean the value for parsing
-                    clean_value = re.sub(r'[^\d.,\-]', '', value_str)
-                    # Handle European format (1.234,56 -> 1234.56)
-                    if ',' in clean_value and '.' in clean_value:
-                        if clean_value.rfind(',') > clean_value.rfind('.'):
-                            clean_value = clean_value.replace('.', '').replace(',', '.')
-                        else:
-                            clean_value = clean_value.replace(',', '')
-                    else:
-                        clean_value = clean_value.replace(',', '')
-                    numeric = float(clean_value) if clean_value else 0.0
-                except ValueError:
-                    numeric = 0.0
-
-                # Determine tag based on context
-                final_tag = default_tag
-                context_lower = context.lower()
-
-                for tag, keywords in context_tags.items():
-                    if any(kw in context_lower for kw in keywords):
-                        # Context keyword found - upgrade confidence and possibly change tag
-                        if default_tag in ['integer', 'decimal', 'quantity']:
-                            final_tag = tag
-                            confidence = 'high' if confidence == 'medium' else confidence
-                        break
-
-                extracted.append(ExtractedValue(
-                    value=value_str,
-                    numeric_value=numeric,
-                    tag=final_tag,
-                    context=context,
-                    confidence=confidence
-                ))
-
-        # Sort by position in text (using context as proxy) and remove low-confidence duplicates
-        # Keep higher confidence matches when values overlap
-        filtered = []
-        for ev in extracted:
-            # Skip low confidence integers that are likely noise (very short numbers)
-            if ev.tag == 'integer' and ev.confidence == 'low' and ev.numeric_value < 10:
+        extracted: list[ExtractedValue] = []
+
+        for window_start in range(0, len(text), chunk_size):
+            base = max(0, window_start - overlap)
+            window = text[base:window_start + chunk_size + overlap]
+            # Each match belongs to exactly one window: the one whose
+            # [accept_lo, accept_hi) core contains its start offset
+            extracted.extend(self._extract_from_window(
+                window,
+                accept_lo=window_start - base,
+                accept_hi=window_start - base + chunk_size,
+            ))
+
+        return extracted
+
+    def _extract_from_window(
+        self, window: str, accept_lo: int, accept_hi: int
+    ) -> list[ExtractedValue]:
+        """Extract values from one text window; see _extract_numeric_values."""
+        raws: list[str] = []
+        metas: list[tuple[str, str]] = []
+        contexts: list[str] = []
+        contexts_lower: list[str] = []
+
+        # Lowercase the window once for keyword matching instead of
+        # re-lowercasing a 100-char slice per match
+        window_lower = window.lower()
+
+        # No duplicate tracking needed: the fused alternation yields at most
+        # one (non-overlapping) match per position, so the same value can
+        # never be reported twice at the same offset
+        for match in _NUMERIC_RE.finditer(window):
+            if not accept_lo <= match.start() < accept_hi:
                 continue
-            filtered.append(ev)
+            value_str = match.group()
+            raws.append(value_str)
+            metas.append(_NUMERIC_META[int(match.lastgroup[1:])])
+
+            # Get surrounding context (50 chars before and after)
+            start = max(0, match.start() - 50)
+            end = min(len(window), match.end() + 50)
+            contexts.append(window[start:end].replace('\n', ' ').strip())
+            # Collapse newlines here too so multi-word keywords that span
+            # a line break still match, as they did when the keyword scan
+            # ran over the normalized context
+            contexts_lower.append(window_lower[start:end].replace('\n', ' '))
+
+        if not raws:
+            return []
+
+        # Parse all collected values in one vectorized pass: cleaning,
+        # European-format normalization (1.234,56 -> 1234.56) and float
+        # conversion run in pandas' C string routines instead of a
+        # per-match Python try/except round-trip
+        import pandas as pd
+
+        clean = pd.Series(raws, dtype="object").str.replace(_CLEAN_RE, '', regex=True)
+        # European format iff a dot exists and the last comma comes after it
+        # (rfind returns -1 when absent, so the two comparisons also cover
+        # the presence checks - no separate contains() passes needed)
+        last_dot = clean.str.rfind('.')
+        euro = (last_dot >= 0) & (clean.str.rfind(',') > last_dot)
+        normalized = (
+            clean.str.replace('.', '', regex=False)
+            .str.replace(',', '.', regex=False)
+            .where(euro, clean.str.replace(',', '', regex=False))
+        )
+        numerics = pd.to_numeric(normalized, errors='coerce').fillna(0.0).tolist()
 
-        return filtered
+        extracted = []
+        for value_str, (default_tag, confidence), context, context_lower, numeric in zip(
+            raws, metas, contexts, contexts_lower, numerics
+        ):
+            # Determine tag based on context
+            final_tag = default_tag
+
+            for tag, keyword_re in _CONTEXT_TAG_RES:
+                if keyword_re.search(context_lower):
+                    # Context keyword found - upgrade confidence and possibly change tag
+                    if default_tag in ['integer', 'decimal', 'quantity']:
+                        final_tag = tag
+                        confidence = 'high' if confidence == 'medium' else confidence
+                    break
+
+            extracted.append(ExtractedValue(
+                value=value_str,
+                numeric_value=numeric,
+                tag=final_tag,
+                context=context,
+                confidence=confidence
+            ))
+
+        return extracted
 
     @property
     def converter(self) -> DocumentConverter:
-        """Lazy initialization of DocumentConverter with comprehensive options."""
+        """Lazy access to the process-wide DocumentConverter."""
         if self._converter is None:
-            pipeline_options = self._create_pipeline_options()
-            self._converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-                }
-            )
+            self._converter = _build_converter()
         return self._converter
 
     def process(
@@ -249,58 +623,238 @@ class PDFProcessor:
         """
         if options is None:
             options = ExportOptions()
+        if progress_callback is not None:
+            progress_callback = _ThrottledCallback(progress_callback)
 
         file_path = Path(file_path)
         output_folder = Path(output_folder)
-        output_folder.mkdir(parents=True, exist_ok=True)
+        os.makedirs(output_folder, exist_ok=True)
 
-        output_files = []
-        base_name = file_path.stem
+        # Build-system style short circuit: when every enabled format maps
+        # to a fixed-name output that post-dates the PDF, skip conversion
+        # outright. Formats with data-dependent outputs (tables, images,
+        # extracted values) cannot be verified without converting, so any
+        # of them being enabled disables the fast path.
+        try:
+            src_mtime = file_path.stat().st_mtime
+        except OSError:
+            src_mtime = None
+        if src_mtime is not None and not (
+            options.csv or options.excel or options.images
+            or options.extract_values
+        ):
+            fixed = [
+                (options.json, output_folder / f"{file_path.stem}.json"),
+                (options.markdown, output_folder / f"{file_path.stem}.md"),
+                (options.html, output_folder / f"{file_path.stem}.html"),
+            ]
+            wanted = [path for enabled, path in fixed if enabled]
+            if wanted and all(_is_fresh(p, src_mtime) for p in wanted):
+                if progress_callback:
+                    progress_callback("Outputs up to date", 100)
+                return ProcessingResult(
+                    success=True,
+                    message=f"Outputs for {file_path.name} already up to date",
+                    output_files=[str(p) for p in wanted]
+                )
 
         try:
-            if progress_callback:
-                progress_callback("Converting document...", 10)
+            # Check the conversion cache before paying for model inference
+            doc = None
+            cache_path = None
+            cache_dir = _document_cache_dir()
+            if cache_dir is not None:
+                try:
+                    cache_path = cache_dir / f"{_document_fingerprint(file_path)}.json.gz"
+                    doc = _load_cached_document(cache_path)
+                except OSError:
+                    cache_path = None
 
-            result = self.converter.convert(str(file_path))
-            doc = result.document
+            if doc is None:
+                if progress_callback:
+                    progress_callback("Converting document...", 10)
+
+                result = self.converter.convert(str(file_path))
+                doc = result.document
+                if cache_path is not None:
+                    _store_cached_document(cache_path, doc)
 
             if progress_callback:
                 progress_callback("Document converted, exporting...", 50)
 
+            return self._export_document(
+                doc, file_path, output_folder, options, progress_callback
+            )
+        except Exception as e:
+            return ProcessingResult(
+                success=False,
+                message=f"Error processing {file_path.name}: {str(e)}",
+                output_files=[]
+            )
+
+    def process_batch(
+        self,
+        file_paths: list[str | Path],
+        output_folder: str | Path,
+        options: ExportOptions | None = None,
+        progress_callback: Callable[[str, int], None] | None = None
+    ) -> list[ProcessingResult]:
+        """
+        Process several PDF files through one batched Docling conversion.
+
+        convert_all lets Docling pipeline model inference across documents,
+        while exports for each finished document are written on a worker
+        thread so disk I/O overlaps with the next conversion.
+
+        Args:
+            file_paths: Paths to the input PDF files.
+            output_folder: Directory for output files.
+            options: Export format options.
+            progress_callback: Optional callback(status_message, percent).
+
+        Returns:
+            One ProcessingResult per input file, in input order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if options is None:
+            options = ExportOptions()
+        if progress_callback is not None:
+            progress_callback = _ThrottledCallback(progress_callback)
+
+        paths = [Path(p) for p in file_paths]
+        output_folder = Path(output_folder)
+        os.makedirs(output_folder, exist_ok=True)
+
+        def _export_one(path: Path, doc) -> ProcessingResult:
+            if doc is None:
+                return ProcessingResult(
+                    success=False,
+                    message=f"Error processing {path.name}: conversion failed",
+                    output_files=[]
+                )
+            try:
+                return self._export_document(doc, path, output_folder, options)
+            except Exception as e:
+                return ProcessingResult(
+                    success=False,
+                    message=f"Error processing {path.name}: {str(e)}",
+                    output_files=[]
+                )
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            try:
+                conversions = self.converter.convert_all(
+                    [str(p) for p in paths], raises_on_error=False
+                )
+                for i, (path, conv) in enumerate(zip(paths, conversions)):
+                    if progress_callback:
+                        progress_callback(
+                            f"Converted {path.name}, exporting...",
+                            int(100 * (i + 1) / len(paths))
+                        )
+                    futures.append(
+                        pool.submit(_export_one, path, getattr(conv, "document", None))
+                    )
+            except Exception as e:
+                # Conversion setup failed outright; fail the files that never
+                # got a result
+                for path in paths[len(futures):]:
+                    futures.append(pool.submit(
+                        ProcessingResult, False,
+                        f"Error processing {path.name}: {str(e)}", []
+                    ))
+
+        results = [future.result() for future in futures]
+        if progress_callback:
+            progress_callback("Complete!", 100)
+        return results
+
+    def _export_document(
+        self,
+        doc,
+        file_path: Path,
+        output_folder: Path,
+        options: ExportOptions,
+        progress_callback: Callable[[str, int], None] | None = None
+    ) -> ProcessingResult:
+        """Run all selected exports for one already-converted document."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        output_files = []
+        base_name = file_path.stem
+        try:
+            src_mtime = file_path.stat().st_mtime
+        except OSError:
+            src_mtime = -1.0
+
+        # The selected formats all write independent files, and the heavy
+        # parts either release the GIL (PNG encode, xlsx deflate) or are
+        # plain file I/O. Exports are therefore submitted to one shared
+        # pool as they become ready and gathered at the end, so total
+        # write time approaches that of the slowest single export.
+        pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        futures = []  # resolved in submission order; each yields a file path
+        try:
+            # Markdown export walks the whole document tree; memoize it so the
+            # .md file, the numeric-value extraction, and the HTML fallback
+            # share one rendering instead of re-exporting
+            get_md = functools.lru_cache(maxsize=1)(doc.export_to_markdown)
+
             # Export JSON (lossless structured format)
             if options.json:
-                json_path = output_folder / f"{base_name}.json"
-                json_output = doc.export_to_dict()
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(json_output, f, indent=4, ensure_ascii=False)
-                output_files.append(str(json_path))
+                def _export_json() -> str:
+                    json_path = output_folder / f"{base_name}.json"
+                    if not _is_fresh(json_path, src_mtime):
+                        _write_json(json_path, doc.export_to_dict())
+                    return str(json_path)
+
+                futures.append(pool.submit(_export_json))
 
             if progress_callback:
                 progress_callback("Exporting text formats...", 60)
 
-            # Export Markdown (high-fidelity text)
+            # Export Markdown (high-fidelity text); encode once and write the
+            # whole buffer in binary mode - one syscall, no TextIOWrapper
             if options.markdown:
-                md_path = output_folder / f"{base_name}.md"
-                with open(md_path, "w", encoding="utf-8") as f:
-                    f.write(doc.export_to_markdown())
-                output_files.append(str(md_path))
+                def _export_markdown() -> str:
+                    md_path = output_folder / f"{base_name}.md"
+                    if _is_fresh(md_path, src_mtime):
+                        return str(md_path)
+                    iter_export = getattr(doc, "iter_export_to_markdown", None)
+                    if iter_export is not None:
+                        # Streaming variant never holds the whole doc in memory
+                        with open(md_path, "wb") as f:
+                            for chunk in iter_export():
+                                f.write(chunk.encode("utf-8"))
+                    else:
+                        md_path.write_bytes(get_md().encode("utf-8"))
+                    return str(md_path)
+
+                futures.append(pool.submit(_export_markdown))
 
             # Export HTML
             if options.html:
-                html_path = output_folder / f"{base_name}.html"
-                html_content = self._generate_html(doc, base_name)
-                with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                output_files.append(str(html_path))
+                def _export_html() -> str:
+                    html_path = output_folder / f"{base_name}.html"
+                    if _is_fresh(html_path, src_mtime):
+                        return str(html_path)
+                    html_path.write_bytes(
+                        self._generate_html(doc, base_name, get_md).encode("utf-8")
+                    )
+                    return str(html_path)
+
+                futures.append(pool.submit(_export_html))
 
             if progress_callback:
                 progress_callback("Extracting tables...", 65)
 
-            # Export tables to CSV/Excel
+            # Export tables to CSV/Excel (iterate in place, no list copy)
             table_count = 0
-            tables = list(doc.tables) if hasattr(doc, 'tables') else []
             table_dataframes = []  # Collect dataframes for combined export
 
+            tables = getattr(doc, 'tables', ()) or ()
             for i, table in enumerate(tables):
                 try:
                     # Pass doc argument to avoid deprecation warning
@@ -311,20 +865,30 @@ class PDFProcessor:
                     # Continue processing other tables if one fails
                     print(f"Warning: Could not export table {i}: {e}")
 
-            # Export all tables to a single Excel file with multiple sheets
-            if options.excel and table_dataframes:
-                xlsx_path = output_folder / f"{base_name}_tables.xlsx"
-                with pd.ExcelWriter(xlsx_path, engine='openpyxl') as writer:
-                    for sheet_name, df in table_dataframes:
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                output_files.append(str(xlsx_path))
-
-            # Export tables to individual CSV files (CSV doesn't support multiple sheets)
-            if options.csv and table_dataframes:
-                for sheet_name, df in table_dataframes:
+            # Table writes join the shared pool: the xlsx workbook and each
+            # CSV are independent files, and the writes are I/O-bound
+            if table_dataframes and (options.excel or options.csv):
+                def _write_tables_xlsx() -> str:
+                    # Single Excel file with one sheet per table
+                    xlsx_path = output_folder / f"{base_name}_tables.xlsx"
+                    with _excel_writer(xlsx_path) as writer:
+                        for sheet_name, df in table_dataframes:
+                            df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    return str(xlsx_path)
+
+                def _write_table_csv(sheet_name: str, df) -> str:
+                    # CSV doesn't support multiple sheets, so one file per table
                     csv_path = output_folder / f"{base_name}_{sheet_name.lower()}.csv"
-                    df.to_csv(csv_path, index=False)
-                    output_files.append(str(csv_path))
+                    _write_csv(df, csv_path)
+                    return str(csv_path)
+
+                if options.excel:
+                    futures.append(pool.submit(_write_tables_xlsx))
+                if options.csv:
+                    futures.extend(
+                        pool.submit(_write_table_csv, sheet_name, df)
+                        for sheet_name, df in table_dataframes
+                    )
 
             # If no tables found, extract numeric values from text
             extracted_values_count = 0
@@ -332,9 +896,8 @@ class PDFProcessor:
                 if progress_callback:
                     progress_callback("No tables found, extracting numeric values...", 70)
 
-                # Get the full text content
-                text_content = doc.export_to_markdown()
-                extracted_values = self._extract_numeric_values(text_content)
+                # Get the full text content (reuses the memoized export)
+                extracted_values = self._extract_numeric_values(get_md())
 
                 if extracted_values:
                     extracted_values_count = len(extracted_values)
@@ -350,54 +913,96 @@ class PDFProcessor:
                         }
                         for ev in extracted_values
                     ]
-                    values_json_path = output_folder / f"{base_name}_extracted_values.json"
-                    with open(values_json_path, "w", encoding="utf-8") as f:
-                        json.dump(values_data, f, indent=4, ensure_ascii=False)
-                    output_files.append(str(values_json_path))
-
-                    # Also export to CSV for easy viewing
-                    values_df = pd.DataFrame(values_data)
-                    values_csv_path = output_folder / f"{base_name}_extracted_values.csv"
-                    values_df.to_csv(values_csv_path, index=False)
-                    output_files.append(str(values_csv_path))
-
-                    # Export to Excel with summary
-                    values_xlsx_path = output_folder / f"{base_name}_extracted_values.xlsx"
-                    with pd.ExcelWriter(values_xlsx_path, engine='openpyxl') as writer:
-                        values_df.to_excel(writer, sheet_name='All Values', index=False)
-                        # Create summary by tag
-                        summary = values_df.groupby('tag').agg({
-                            'numeric_value': ['count', 'sum', 'mean', 'min', 'max']
-                        }).round(2)
-                        summary.columns = ['Count', 'Sum', 'Average', 'Min', 'Max']
-                        summary.to_excel(writer, sheet_name='Summary by Tag')
-                    output_files.append(str(values_xlsx_path))
+                    def _write_values_json() -> str:
+                        values_json_path = output_folder / f"{base_name}_extracted_values.json"
+                        _write_json(values_json_path, values_data)
+                        return str(values_json_path)
+
+                    # Also export to CSV for easy viewing; the rows are already
+                    # dicts, so csv.DictWriter streams them directly instead of
+                    # round-tripping through a DataFrame's typed columns
+                    def _write_values_csv() -> str:
+                        values_csv_path = output_folder / f"{base_name}_extracted_values.csv"
+                        with open(values_csv_path, 'w', newline='',
+                                  encoding='utf-8', buffering=1 << 20) as f:
+                            writer = csv.DictWriter(
+                                f,
+                                fieldnames=['value', 'numeric_value', 'tag',
+                                            'context', 'confidence'],
+                            )
+                            writer.writeheader()
+                            writer.writerows(values_data)
+                        return str(values_csv_path)
+
+                    def _write_values_xlsx() -> str:
+                        # Excel export with a per-tag summary sheet; pandas is
+                        # only needed here, for the groupby
+                        import pandas as pd
+
+                        values_df = pd.DataFrame(values_data)
+                        values_xlsx_path = output_folder / f"{base_name}_extracted_values.xlsx"
+                        with _excel_writer(values_xlsx_path) as writer:
+                            values_df.to_excel(writer, sheet_name='All Values', index=False)
+                            # Named aggregations produce the final column names
+                            # directly - no MultiIndex build plus rename - and
+                            # sort=False skips ordering the group keys
+                            summary = values_df.groupby('tag', sort=False, observed=True).agg(
+                                Count=('numeric_value', 'count'),
+                                Sum=('numeric_value', 'sum'),
+                                Average=('numeric_value', 'mean'),
+                                Min=('numeric_value', 'min'),
+                                Max=('numeric_value', 'max'),
+                            ).round(2)
+                            summary.to_excel(writer, sheet_name='Summary by Tag')
+                        return str(values_xlsx_path)
+
+                    futures.append(pool.submit(_write_values_json))
+                    futures.append(pool.submit(_write_values_csv))
+                    futures.append(pool.submit(_write_values_xlsx))
 
             if progress_callback:
                 progress_callback("Extracting pictures...", 80)
 
-            # Export pictures/figures as image files
-            picture_count = 0
+            # Export pictures/figures as image files; the PNG encodes release
+            # the GIL in libpng, so fanning them onto the pool scales well for
+            # figure-heavy documents
+            picture_futures = []
             if options.images:
-                pictures = list(doc.pictures) if hasattr(doc, 'pictures') else []
+                # Resolve the folder path once; the loop then builds plain
+                # strings instead of a Path object per figure
                 images_folder = output_folder / f"{base_name}_images"
-
+                images_folder_str = os.fspath(images_folder)
+                images_folder_created = False
+
+                def _save_picture(image, img_path: str) -> str:
+                    image.save(
+                        img_path,
+                        format="PNG",
+                        compress_level=options.png_compress_level,
+                        optimize=False,
+                    )
+                    return img_path
+
+                pictures = getattr(doc, 'pictures', ()) or ()
                 for i, picture in enumerate(pictures):
                     try:
-                        # Try to get the image from the picture item
-                        image = None
-                        if hasattr(picture, 'get_image'):
-                            image = picture.get_image(doc)
-                        elif hasattr(picture, 'image') and picture.image is not None:
-                            image = picture.image
+                        # Try to get the image from the picture item; one
+                        # getattr probe per access path instead of hasattr+attr
+                        get_image = getattr(picture, 'get_image', None)
+                        if get_image is not None:
+                            image = get_image(doc)
+                        else:
+                            image = getattr(picture, 'image', None)
 
                         if image is not None:
                             # Create images folder only if we have images
-                            images_folder.mkdir(parents=True, exist_ok=True)
-                            img_path = images_folder / f"figure_{i+1}.png"
-                            image.save(str(img_path))
-                            output_files.append(str(img_path))
-                            picture_count += 1
+                            if not images_folder_created:
+                                os.makedirs(images_folder_str, exist_ok=True)
+                                images_folder_created = True
+                            img_path = f"{images_folder_str}{os.sep}figure_{i+1}.png"
+                            picture_futures.append(
+                                (i, pool.submit(_save_picture, image, img_path))
+                            )
                     except Exception as e:
                         print(f"Warning: Could not export picture {i}: {e}")
 
@@ -405,81 +1010,111 @@ class PDFProcessor:
                 progress_callback("Exporting key-value data...", 90)
 
             # Export key-value items if present (forms, structured data)
-            if hasattr(doc, 'key_value_items') and doc.key_value_items:
+            kv_items = getattr(doc, 'key_value_items', None) or ()
+            if kv_items:
                 kv_data = []
-                for kv in doc.key_value_items:
+                for kv in kv_items:
                     try:
                         kv_entry = {}
-                        if hasattr(kv, 'key'):
-                            kv_entry['key'] = str(kv.key) if kv.key else ''
-                        if hasattr(kv, 'value'):
-                            kv_entry['value'] = str(kv.value) if kv.value else ''
+                        key = getattr(kv, 'key', None)
+                        if key is not None:
+                            kv_entry['key'] = str(key)
+                        value = getattr(kv, 'value', None)
+                        if value is not None:
+                            kv_entry['value'] = str(value)
                         if kv_entry:
                             kv_data.append(kv_entry)
                     except Exception:
                         pass
 
                 if kv_data:
-                    kv_path = output_folder / f"{base_name}_key_values.json"
-                    with open(kv_path, "w", encoding="utf-8") as f:
-                        json.dump(kv_data, f, indent=4, ensure_ascii=False)
-                    output_files.append(str(kv_path))
+                    def _write_kv() -> str:
+                        kv_path = output_folder / f"{base_name}_key_values.json"
+                        _write_json(kv_path, kv_data)
+                        return str(kv_path)
+
+                    futures.append(pool.submit(_write_kv))
 
             # Export form items if present
-            if hasattr(doc, 'form_items') and doc.form_items:
+            form_items = getattr(doc, 'form_items', None) or ()
+            if form_items:
                 form_data = []
-                for form in doc.form_items:
+                for form in form_items:
                     try:
                         form_entry = {}
-                        if hasattr(form, 'name'):
-                            form_entry['name'] = str(form.name) if form.name else ''
-                        if hasattr(form, 'value'):
-                            form_entry['value'] = str(form.value) if form.value else ''
+                        name = getattr(form, 'name', None)
+                        if name is not None:
+                            form_entry['name'] = str(name)
+                        value = getattr(form, 'value', None)
+                        if value is not None:
+                            form_entry['value'] = str(value)
                         if form_entry:
                             form_data.append(form_entry)
                     except Exception:
                         pass
 
                 if form_data:
-                    form_path = output_folder / f"{base_name}_form_data.json"
-                    with open(form_path, "w", encoding="utf-8") as f:
-                        json.dump(form_data, f, indent=4, ensure_ascii=False)
-                    output_files.append(str(form_path))
-
-            if progress_callback:
-                progress_callback("Complete!", 100)
-
-            # Get page count if available
-            page_count = 0
-            if hasattr(doc, 'pages'):
-                page_count = len(list(doc.pages))
-
-            # Build informative message
-            message = f"Successfully processed {file_path.name}"
-            if table_count == 0 and extracted_values_count > 0:
-                message += f" (no tables found, extracted {extracted_values_count} numeric values)"
-            elif table_count == 0:
-                message += " (no tables or numeric values found)"
+                    def _write_forms() -> str:
+                        form_path = output_folder / f"{base_name}_form_data.json"
+                        _write_json(form_path, form_data)
+                        return str(form_path)
 
-            return ProcessingResult(
-                success=True,
-                message=message,
-                output_files=output_files,
-                table_count=table_count,
-                page_count=page_count,
-                picture_count=picture_count,
-                extracted_values_count=extracted_values_count
-            )
+                    futures.append(pool.submit(_write_forms))
 
-        except Exception as e:
-            return ProcessingResult(
-                success=False,
-                message=f"Error processing {file_path.name}: {str(e)}",
-                output_files=[]
-            )
+            # Gather every export in submission order; one failure doesn't
+            # abort the rest
+            for future in futures:
+                try:
+                    output_files.append(future.result())
+                except Exception as e:
+                    print(f"Warning: Could not write export: {e}")
 
-    def _generate_html(self, doc, title: str) -> str:
-        """Generate styled HTML output from document."""
+            picture_count = 0
+            for i, future in picture_futures:
+                try:
+                    output_files.append(future.result())
+                    picture_count += 1
+                except Exception as e:
+                    print(f"Warning: Could not export picture {i}: {e}")
+        finally:
+            # Always release the workers: an exporter raising between
+            # submission and gather must not leak parked threads
+            pool.shutdown()
+
+
+        if progress_callback:
+            progress_callback("Complete!", 100)
+
+        # Get page count if available (no intermediate list)
+        pages = getattr(doc, 'pages', ())
+        if hasattr(pages, '__len__'):
+            page_count = len(pages)
+        else:
+            page_count = sum(1 for _ in pages)
+
+        # Build informative message
+        message = f"Successfully processed {file_path.name}"
+        if table_count == 0 and extracted_values_count > 0:
+            message += f" (no tables found, extracted {extracted_values_count} numeric values)"
+        elif table_count == 0:
+            message += " (no tables or numeric values found)"
+
+        return ProcessingResult(
+            success=True,
+            message=message,
+            output_files=output_files,
+            table_count=table_count,
+            page_count=page_count,
+            picture_count=picture_count,
+            extracted_values_count=extracted_values_count
+        )
+
+    def _generate_html(self, doc, title: str, get_md=None) -> str:
+        """Generate styled HTML output from document.
+
+        get_md, when given, supplies a memoized doc.export_to_markdown so
+        the fallback path shares the rendering with the other exports.
+        """
         # Try native HTML export if available
         if hasattr(doc, 'export_to_html'):
             try:
@@ -487,59 +1122,16 @@ class PDFProcessor:
             except Exception:
                 pass
 
-        # Fallback: Convert markdown to basic HTML
-        md_content = doc.export_to_markdown()
-
-        # Basic markdown to HTML conversion
-        import html
-        content = html.escape(md_content)
-
-        # Convert markdown headers
-        lines = content.split('\n')
-        html_lines = []
-        for line in lines:
-            if line.startswith('### '):
-                html_lines.append(f'<h3>{line[4:]}</h3>')
-            elif line.startswith('## '):
-                html_lines.append(f'<h2>{line[3:]}</h2>')
-            elif line.startswith('# '):
-                html_lines.append(f'<h1>{line[2:]}</h1>')
-            elif line.strip() == '':
-                html_lines.append('<br>')
-            else:
-                html_lines.append(f'<p>{line}</p>')
-
-        body = '\n'.join(html_lines)
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 2rem;
-            line-height: 1.6;
-        }}
-        h1, h2, h3 {{ color: #333; }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1rem 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{ background-color: #f5f5f5; }}
-    </style>
-</head>
-<body>
-{body}
-</body>
-</html>"""
+        # Fallback: Convert markdown to basic HTML with three compiled-regex
+        # passes over the whole document (headers, blank lines, paragraphs)
+        md_content = get_md() if get_md is not None else doc.export_to_markdown()
+
+        body = html.escape(md_content)
+        body = _MD_HEADER_RE.sub(
+            lambda m: f'<h{len(m.group(1))}>{m.group(2)}</h{len(m.group(1))}>',
+            body
+        )
+        body = _MD_BLANK_RE.sub('<br>', body)
+        body = _MD_PARA_RE.sub(r'<p>\1</p>', body)
+
+        return _HTML_TEMPLATE.format_map({'title': title, 'body': body})
@@ -7,27 +7,44 @@ using IBM Docling's AI-powered document understanding.
 
 import sys
 
+# Built on first main() call; repeat invocations in one process (scripted
+# smoke tests) reuse the resolved font instead of re-hitting the font DB
+_APP_FONT = None
+
 
 def main():
-    # Setup model cache before any imports that might trigger model loading
+    global _APP_FONT
+    # Run model-cache setup (mkdir, env vars, symlink patch) on a worker
+    # thread so its filesystem I/O overlaps with Qt initialization. It is
+    # joined before the GUI module is imported, which keeps the guarantee
+    # that everything is in place before any import touches HuggingFace.
+    import threading
     from config import setup_docling_cache, get_default_output_dir
-    setup_docling_cache()
 
-    # Now import and run the GUI
-    from gui import QApplication, QFont, MainWindow
+    setup_thread = threading.Thread(target=setup_docling_cache, daemon=True)
+    setup_thread.start()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QFont
 
     app = QApplication(sys.argv)
-    app.setStyle("Fusion")
+    if app.style().objectName().lower() != "fusion":
+        app.setStyle("Fusion")
 
     # Set application-wide font
-    font = QFont("Segoe UI", 10)
-    app.setFont(font)
+    if _APP_FONT is None:
+        _APP_FONT = QFont("Segoe UI", 10)
+    app.setFont(_APP_FONT)
 
     # Set application metadata
     app.setApplicationName("PDF Extractor")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("Your Company")
 
+    # Cache setup must be finished before gui (and with it docling) loads
+    setup_thread.join()
+    from gui import MainWindow
+
     window = MainWindow()
 
     # Update default output folder from config
@@ -36,6 +53,13 @@ def main():
 
     window.show()
 
+    # Warm the Docling converter (pipeline + model init) on a worker
+    # thread once the window is visible; the first real conversion then
+    # finds it ready instead of paying the multi-second load itself
+    threading.Thread(
+        target=lambda: window.processor.converter, daemon=True
+    ).start()
+
     sys.exit(app.exec())
 
 